@@ -1,114 +1,325 @@
 """
 Unified script to export test cases to Word, Excel, and PDF formats
-Install requirements: pip install python-docx openpyxl reportlab
+Install requirements: pip install python-docx xlsxwriter reportlab
+Optional: pip install google-re2 (linear-time scanning of large C#/Python files)
+Optional: pip install orjson (faster JSON parsing; files with integers beyond 64 bits use json)
 """
 
+import hashlib
 import json
+import mmap
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 
-def load_test_cases_from_file(input_file):
-    """Load test cases from various file formats (JSON, C#, Python)"""
-    ext = Path(input_file).suffix.lower()
+from test_case_fields import FIELD_DEFAULTS, FIELDS, iter_rows
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _compile(pattern):
+    """Compile a pattern with RE2 when available, otherwise with the stdlib re module"""
+    if re2 is not None:
+        options = re2.Options()
+        options.max_mem = 8 << 20
+        try:
+            return re2.compile(pattern, options)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+# orjson only handles 64-bit integers: older releases silently turn larger ones into
+# floats, newer ones reject them. Any run of 19+ digits could be out of range, so such
+# files, and anything orjson refuses (non-UTF-8, lone surrogates), go through json.loads.
+_LONG_NUMBER_RE = _compile(rb'\d{19}')
+
+def _json_loads(content):
+    """Parse JSON bytes with orjson when it is installed and lossless, otherwise with json.loads"""
+    if orjson is not None and not _LONG_NUMBER_RE.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+# Test case extraction patterns, compiled once at import time; they scan raw bytes
+# C# tests are found in a single pass: attributed async test methods first, then the
+# [TestCase(...)] / "// TestCase:" fallback forms, told apart by which groups matched.
+# Groups are unnamed because RE2 wants bytes group names for bytes patterns and re wants str.
+# The comment form stays on its line so an empty one cannot swallow the next test's attribute.
+# Bytes-mode \w is ASCII-only, so method names also accept any non-ASCII character; this is
+# written as [^\x00-\x7f] because RE2 reads the pattern as UTF-8, where [\x80-\xff] is Latin-1 only.
+_CS_TEST_RE = _compile(
+    rb'(?:\s*///\s*(.*))?\s*\[\s*(Fact|Test|TestCase)[^\]]*\]\s*(?:public|private|protected)?\s*async\s*Task\s+((?:\w|[^\x00-\x7f])+)'
+    rb'|\[TestCase\s*\(([^)]*)\)\]'
+    rb'|//[ \t]*TestCase:[ \t]*(.*)'
+)
+_PY_TEST_RE = _compile(rb'#\s*TestCase:\s*(.*)')
+
+# Bump whenever the cache layout or the scanners' output changes, so older caches are ignored
+_CACHE_VERSION = 4
+
+def _cache_path(input_file):
+    """Path of the parsed-test-case cache kept next to a source file"""
+    path = Path(input_file)
+    return path.with_suffix(path.suffix + '.tcscache')
+
+def _read_cache(input_file):
+    """Return the cached entry for a source file, or None if missing, unreadable or malformed"""
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        if ext == '.json':
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError as e:
-                print(f"✗ Error: Invalid JSON format in '{input_file}'\n   {e}")
-                return None
-        elif ext == '.cs':
-            # Enhanced C# test case extraction: supports [Fact], [Test], [TestCase], and method names
-            import re
-            test_cases = []
-            # Find all test methods with [Fact] or [Test] attributes
-            # Optionally, extract summary comments above methods
-            pattern = r'(?:\s*///\s*(?P<summary>.*))?\s*\[\s*(Fact|Test|TestCase)[^\]]*\]\s*(?:public|private|protected)?\s*async\s*Task\s+(?P<method>\w+)'
-            for match in re.finditer(pattern, content):
-                tc_name = match.group('method')
-                summary = match.group('summary')
-                tc_id = f'TC_{len(test_cases)+1:03d}'
-                display_name = summary if summary else tc_name.replace('_', ' ')
-                test_cases.append({'id': tc_id, 'name': display_name})
-            # If no matches, fallback to [TestCase] and comment-based extraction
-            if not test_cases:
-                for match in re.finditer(r'\[TestCase\s*\(([^)]*)\)\]|//\s*TestCase:\s*(.*)', content):
-                    if match.group(1):
-                        args = [x.strip(' "') for x in match.group(1).split(',')]
-                        tc_id = args[0] if len(args) > 0 else None
-                        tc_name = args[1] if len(args) > 1 else None
-                    else:
-                        tc_id, tc_name = None, match.group(2)
-                    test_cases.append({'id': tc_id or f'TC_{len(test_cases)+1:03d}', 'name': tc_name or 'Unnamed Test'})
-            return test_cases
-        elif ext == '.py':
-            # Basic Python test case extraction (looks for docstrings or comments with 'TestCase:')
-            import re
-            test_cases = []
-            # Example: # TestCase: TC_001, Login Test
-            for match in re.finditer(r'#\s*TestCase:\s*(.*)', content):
-                parts = [x.strip() for x in match.group(1).split(',')]
-                tc_id = parts[0] if len(parts) > 0 else None
-                tc_name = parts[1] if len(parts) > 1 else None
-                test_cases.append({'id': tc_id or f'TC_{len(test_cases)+1:03d}', 'name': tc_name or 'Unnamed Test'})
-            return test_cases
-        else:
-            print(f"✗ Unsupported file format: {ext}")
+        with open(_cache_path(input_file), 'rb') as f:
+            entry = _json_loads(f.read())
+    except Exception:
+        return None
+    # The cache is plain JSON data: accept only the exact shape _write_cache produces
+    if not isinstance(entry, dict) or entry.get('version') != _CACHE_VERSION:
+        return None
+    if type(entry.get('mtime_ns')) is not int or not isinstance(entry.get('digest'), str):
+        return None
+    test_cases = entry.get('test_cases')
+    if not isinstance(test_cases, list):
+        return None
+    for tc in test_cases:
+        if not isinstance(tc, dict) or tc.keys() != {'id', 'name'}:
+            return None
+        if not isinstance(tc['id'], str) or not isinstance(tc['name'], str):
             return None
-    except FileNotFoundError:
+    return entry
+
+def _write_cache(input_file, mtime_ns, digest, test_cases):
+    """Store parsed test cases next to the source file; failures are ignored"""
+    entry = {'version': _CACHE_VERSION, 'mtime_ns': mtime_ns, 'digest': digest, 'test_cases': test_cases}
+    try:
+        with open(_cache_path(input_file), 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+def _map_file(f):
+    """Memory-map an open binary file read-only (mmap rejects empty files)"""
+    if os.fstat(f.fileno()).st_size == 0:
+        return nullcontext(b'')
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _text(value):
+    """Decode a matched byte string, dropping a trailing CR left by CRLF line endings"""
+    return value.decode('utf-8').rstrip('\r')
+
+def _split_fields(value, chars=None):
+    """Split a matched 'id, name' byte string into its (id, name) parts"""
+    parts = [x.strip(chars) for x in _text(value).split(',')]
+    return parts[0], parts[1] if len(parts) > 1 else None
+
+def _scan_cs(content):
+    """
+    Extract test cases from C# source bytes
+    
+    >>> _scan_cs('[Fact]\\npublic async Task Tést_Foo()'.encode('utf-8'))
+    [{'id': 'TC_001', 'name': 'Tést Foo'}]
+    >>> _scan_cs('[Fact]\\npublic async Task 登录_测试()\\n[Fact]\\npublic async Task Ελληνικά()'.encode('utf-8'))
+    [{'id': 'TC_001', 'name': '登录 测试'}, {'id': 'TC_002', 'name': 'Ελληνικά'}]
+    >>> _scan_cs(b'// TestCase: \\n[Fact]\\npublic async Task Do_It()')
+    [{'id': 'TC_001', 'name': 'Do It'}]
+    """
+    # Enhanced C# test case extraction: supports [Fact], [Test], [TestCase], and method names
+    # Every form needs 'Task' or 'TestCase'; a native substring search rules out most other files
+    if content.find(b'Task') == -1 and content.find(b'TestCase') == -1:
+        return []
+    methods = []
+    fallbacks = []
+    # Find all test methods with [Fact] or [Test] attributes
+    # Optionally, extract summary comments above methods
+    for match in _CS_TEST_RE.finditer(content):
+        groups = match.groups()
+        if groups[2] is not None:
+            methods.append(groups)
+        elif not methods:
+            fallbacks.append(groups)
+    if methods:
+        return [
+            {'id': f'TC_{idx:03d}', 'name': _text(summary) if summary else _text(method).replace('_', ' ')}
+            for idx, (summary, _, method, _, _) in enumerate(methods, 1)
+        ]
+    # [TestCase] and comment-based matches only count if no test methods are found
+    fields = [
+        _split_fields(args, ' "') if args else (None, comment and _text(comment))
+        for _, _, _, args, comment in fallbacks
+    ]
+    return [
+        {'id': tc_id or f'TC_{idx:03d}', 'name': tc_name or 'Unnamed Test'}
+        for idx, (tc_id, tc_name) in enumerate(fields, 1)
+    ]
+
+def _scan_py(content):
+    """Extract test cases from Python source bytes"""
+    # Basic Python test case extraction (looks for docstrings or comments with 'TestCase:')
+    # Example: # TestCase: TC_001, Login Test
+    if content.find(b'TestCase') == -1:
+        return []
+    fields = [_split_fields(match.group(1)) for match in _PY_TEST_RE.finditer(content)]
+    return [
+        {'id': tc_id or f'TC_{idx:03d}', 'name': tc_name or 'Unnamed Test'}
+        for idx, (tc_id, tc_name) in enumerate(fields, 1)
+    ]
+
+def _load_json(path):
+    """Load test cases from a JSON file"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    try:
+        return _json_loads(content)
+    except json.JSONDecodeError as e:
+        print(f"✗ Error: Invalid JSON format in '{path}'\n   {e}")
+        return None
+
+def _load_source(path, scan):
+    """Load test cases from a source file with the given scanner, reusing the cache when possible"""
+    # Reuse a previous scan if the source is unchanged (mtime first, then content hash)
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _read_cache(path)
+    if cached is not None and cached['mtime_ns'] == mtime_ns:
+        return cached['test_cases']
+    with open(path, 'rb') as f, _map_file(f) as content:
+        digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+        if cached is not None and cached['digest'] == digest:
+            _write_cache(path, mtime_ns, digest, cached['test_cases'])
+            return cached['test_cases']
+        test_cases = scan(content)
+    _write_cache(path, mtime_ns, digest, test_cases)
+    return test_cases
+
+def _load_cs(path):
+    """Load test cases from a C# test file"""
+    return _load_source(path, _scan_cs)
+
+def _load_py(path):
+    """Load test cases from a Python test file"""
+    return _load_source(path, _scan_py)
+
+# Loader for each supported file extension
+_LOADERS = {
+    '.json': _load_json,
+    '.cs': _load_cs,
+    '.py': _load_py,
+}
+
+def load_test_cases_from_file(input_file):
+    """Load test cases from various file formats (JSON, C#, Python)"""
+    path = Path(input_file)
+    if not path.is_file():
         print(f"✗ Error: File '{input_file}' not found!")
         print(f"   Please provide a valid test case file.")
         return None
+    loader = _LOADERS.get(path.suffix.lower())
+    if loader is None:
+        print(f"✗ Unsupported file format: {path.suffix.lower()}")
+        return None
+    try:
+        return loader(path)
     except Exception as e:
         print(f"✗ Error loading file: {e}")
         return None
 
+def _check_objects(test_cases):
+    """Return True if every test case is a dictionary, otherwise print the first offender"""
+    for idx, tc in enumerate(test_cases, 1):
+        if not isinstance(tc, dict):
+            print(f"✗ Error: Test case #{idx} is not an object: {tc!r}")
+            return False
+    return True
+
+def _normalize(test_cases):
+    """
+    Validate loaded test cases and fill in every field as a string, in place
+    
+    Returns the list, or None (after printing why) if the input is not a list
+    of dictionaries.
+    """
+    if not isinstance(test_cases, list):
+        print(f"✗ Error: Expected a list of test cases, got {type(test_cases).__name__}")
+        return None
+    if not _check_objects(test_cases):
+        return None
+    for idx, tc in enumerate(test_cases, 1):
+        tc['id'] = str(tc.get('id', f'TC_{idx:03d}'))
+        for field, default in FIELD_DEFAULTS.items():
+            tc[field] = str(tc.get(field, default))
+    return test_cases
+
+def _to_columns(test_cases):
+    """Transpose test case dictionaries into one string list per field, leaving them untouched"""
+    columns = list(zip(*iter_rows(test_cases))) or [()] * len(FIELDS)
+    return {field: list(values) for field, values in zip(FIELDS, columns)}
+
 def export_all_formats(test_cases, base_filename="test_cases"):
-    """Export test cases to all formats"""
+    """Export a sequence of test case dictionaries to all formats"""
     print("\n🚀 Starting export to all formats...\n")
     
     results = {}
     
-    # Export to Word
+    # Every exporter accepts the columnar form; building it fills in missing
+    # fields without modifying the caller's dictionaries
+    if not _check_objects(test_cases):
+        print("⚠️  No files were generated. Check error messages above.")
+        return results
+    test_cases = _to_columns(test_cases)
+    
+    tasks = []
+    
+    # Word export
     try:
         from export_to_word import create_test_case_word
-        word_file = f"{base_filename}.docx"
-        create_test_case_word(test_cases, word_file)
-        results['word'] = word_file
+        tasks.append(('word', 'Word', 'Word document saved', create_test_case_word, f"{base_filename}.docx"))
     except ImportError:
         print("✗ Word export failed: export_to_word.py not found")
-    except Exception as e:
-        print(f"✗ Word export failed: {e}")
     
-    # Export to Excel
+    # Excel export
     try:
         from export_to_excel import create_test_case_excel
-        excel_file = f"{base_filename}.xlsx"
-        create_test_case_excel(test_cases, excel_file)
-        results['excel'] = excel_file
+        tasks.append(('excel', 'Excel', 'Excel file saved', create_test_case_excel, f"{base_filename}.xlsx"))
     except ImportError:
         print("✗ Excel export failed: export_to_excel.py not found")
-    except Exception as e:
-        print(f"✗ Excel export failed: {e}")
     
-    # Export to PDF
+    # PDF export
     try:
         from export_to_pdf import create_test_case_pdf
-        pdf_file = f"{base_filename}.pdf"
-        create_test_case_pdf(test_cases, pdf_file)
-        results['pdf'] = pdf_file
+        tasks.append(('pdf', 'PDF', 'PDF document saved', create_test_case_pdf, f"{base_filename}.pdf"))
     except ImportError:
         print("✗ PDF export failed: export_to_pdf.py not found")
-    except Exception as e:
-        print(f"✗ PDF export failed: {e}")
+    
+    # The exporters are independent, so run them in separate processes
+    if tasks:
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [
+                (format_type, label, saved, executor.submit(create_fn, test_cases, output_file))
+                for format_type, label, saved, create_fn, output_file in tasks
+            ]
+            # Collect and report in submission order so the output stays Word, Excel, PDF;
+            # the workers print nothing, so their lines cannot interleave
+            for format_type, label, saved, future in futures:
+                try:
+                    results[format_type] = future.result()
+                    print(f"✓ {saved}: {results[format_type]}")
+                except Exception as e:
+                    print(f"✗ {label} export failed: {e}")
     
     print("\n✅ Export completed!")
     if results:
         print(f"Generated {len(results)} file(s):")
-        for format_type, filename in results.items():
-            print(f"  • {format_type.upper()}: {filename}")
+        sys.stdout.write(''.join(
+            f"  • {format_type.upper()}: {filename}\n"
+            for format_type, filename in results.items()
+        ))
     else:
         print("⚠️  No files were generated. Check error messages above.")
     
@@ -129,16 +340,20 @@ if __name__ == "__main__":
     print(f"\n📂 Looking for: {input_filename}")
 
     test_cases = load_test_cases_from_file(input_filename)
+    # Validate the loaded data and fill in defaults before listing it
+    if test_cases is not None:
+        test_cases = _normalize(test_cases)
 
     if test_cases:
         print(f"✅ Successfully loaded {len(test_cases)} test case(s)")
 
         # Show summary of loaded test cases
         print("\n📋 Test Cases Found:")
-        for idx, tc in enumerate(test_cases, 1):
-            tc_name = tc.get('name', 'Unnamed Test')
-            tc_id = tc.get('id', f'TC_{idx:03d}')
-            print(f"   {idx}. [{tc_id}] {tc_name}")
+        # Build the listing once and write it in a single call
+        sys.stdout.write(''.join(
+            f"   {idx}. [{tc['id']}] {tc['name']}\n"
+            for idx, tc in enumerate(test_cases, 1)
+        ))
 
         # Export to all formats
         export_all_formats(test_cases, Path(input_filename).stem + "_output")
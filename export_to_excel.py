@@ -1,25 +1,52 @@
 """
 Export test cases to Excel spreadsheet (.xlsx)
-Requires: openpyxl
-Install: pip install openpyxl
+Requires: xlsxwriter
+Install: pip install xlsxwriter
+Optional: pip install zlib-ng (faster compression of the saved file)
 """
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+import xlsxwriter
 from datetime import datetime
 
+from test_case_fields import count, iter_rows
+from zip_compression import fast_deflate
+
+# Cell formats, registered once per workbook
+_TITLE_FORMAT = {'bold': True, 'font_size': 16, 'font_color': '#FFFFFF', 'bg_color': '#366092',
+                 'align': 'center', 'valign': 'vcenter'}
+_METADATA_FORMAT = {'italic': True, 'font_size': 10, 'align': 'center'}
+_HEADER_FORMAT = {'bold': True, 'font_size': 11, 'font_color': '#FFFFFF', 'bg_color': '#4472C4',
+                  'align': 'center', 'valign': 'vcenter', 'text_wrap': True, 'border': 1}
+_CELL_FORMAT = {'valign': 'top', 'text_wrap': True, 'border': 1}
+_PASS_FORMAT = dict(_CELL_FORMAT, bg_color='#C6EFCE', font_color='#006100')
+_FAIL_FORMAT = dict(_CELL_FORMAT, bg_color='#FFC7CE', font_color='#9C0006')
+
 def create_test_case_excel(test_cases, output_file="test_cases.xlsx"):
     """
     Convert test cases to a formatted Excel spreadsheet
     
     Args:
-        test_cases: List of dictionaries containing test case information
+        test_cases: List of dictionaries containing test case information,
+                    or a columnar {field: [values]} mapping
         output_file: Output filename for the Excel file
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Test Cases"
+    total = count(test_cases)
+    
+    # constant_memory mode flushes each row to disk once the next row is started.
+    # Strings are written verbatim, never turned into formulas or hyperlinks.
+    wb = xlsxwriter.Workbook(output_file, {
+        'constant_memory': True,
+        'use_zip64': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+    })
+    ws = wb.add_worksheet("Test Cases")
+    title_fmt = wb.add_format(_TITLE_FORMAT)
+    metadata_fmt = wb.add_format(_METADATA_FORMAT)
+    header_fmt = wb.add_format(_HEADER_FORMAT)
+    cell_fmt = wb.add_format(_CELL_FORMAT)
+    pass_fmt = wb.add_format(_PASS_FORMAT)
+    fail_fmt = wb.add_format(_FAIL_FORMAT)
     
     # Define headers
     headers = [
@@ -34,97 +61,56 @@ def create_test_case_excel(test_cases, output_file="test_cases.xlsx"):
         'Priority',
         'Test Type'
     ]
+    header_row = 2  # zero-based, i.e. spreadsheet row 3
+    
+    # Adjust column widths
+    column_widths = {
+        'A:A': 15,  # ID
+        'B:B': 30,  # Name
+        'C:C': 35,  # Description
+        'D:D': 25,  # Preconditions
+        'E:E': 40,  # Steps
+        'F:F': 35,  # Expected
+        'G:G': 35,  # Actual
+        'H:H': 15,  # Status
+        'I:I': 12,  # Priority
+        'J:J': 15   # Type
+    }
+    
+    for col, width in column_widths.items():
+        ws.set_column(col, width)
     
     # Add title row
-    ws.merge_cells('A1:J1')
-    title_cell = ws['A1']
-    title_cell.value = 'Test Cases Documentation'
-    title_cell.font = Font(size=16, bold=True, color="FFFFFF")
-    title_cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    title_cell.alignment = Alignment(horizontal='center', vertical='center')
-    ws.row_dimensions[1].height = 30
+    ws.set_row(0, 30)
+    ws.merge_range('A1:J1', 'Test Cases Documentation', title_fmt)
     
     # Add metadata row
-    ws.merge_cells('A2:J2')
-    metadata_cell = ws['A2']
-    metadata_cell.value = f'Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | Total Test Cases: {len(test_cases)}'
-    metadata_cell.font = Font(size=10, italic=True)
-    metadata_cell.alignment = Alignment(horizontal='center')
+    ws.merge_range('A2:J2', f'Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | Total Test Cases: {total}', metadata_fmt)
     
     # Add headers
-    header_row = 3
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=header_row, column=col_num)
-        cell.value = header
-        cell.font = Font(bold=True, color="FFFFFF", size=11)
-        cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-        cell.border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-    
-    ws.row_dimensions[header_row].height = 35
+    ws.set_row(header_row, 35)
+    ws.write_row(header_row, 0, headers, header_fmt)
     
     # Add test case data
-    for row_num, test_case in enumerate(test_cases, start=header_row + 1):
-        data = [
-            test_case.get('id', f'TC_{row_num - header_row:03d}'),
-            test_case.get('name', 'Unnamed Test'),
-            test_case.get('description', 'N/A'),
-            test_case.get('preconditions', 'N/A'),
-            test_case.get('steps', 'N/A'),
-            test_case.get('expected_result', 'N/A'),
-            test_case.get('actual_result', ''),
-            test_case.get('status', 'Not Executed'),
-            test_case.get('priority', 'Medium'),
-            test_case.get('test_type', 'Functional')
-        ]
+    status_col = 7
+    for row_num, values in enumerate(iter_rows(test_cases), start=header_row + 1):
+        # Status color coding
+        status = values[status_col].lower()
+        if status == 'pass':
+            status_fmt = pass_fmt
+        elif status == 'fail':
+            status_fmt = fail_fmt
+        else:
+            status_fmt = cell_fmt
         
-        for col_num, value in enumerate(data, 1):
-            cell = ws.cell(row=row_num, column=col_num)
-            cell.value = str(value)
-            cell.alignment = Alignment(vertical='top', wrap_text=True)
-            cell.border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            
-            # Status color coding
-            if col_num == 8:  # Status column
-                if value.lower() == 'pass':
-                    cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                    cell.font = Font(color="006100")
-                elif value.lower() == 'fail':
-                    cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-                    cell.font = Font(color="9C0006")
-        
-        ws.row_dimensions[row_num].height = 60
-    
-    # Adjust column widths
-    column_widths = {
-        'A': 15,  # ID
-        'B': 30,  # Name
-        'C': 35,  # Description
-        'D': 25,  # Preconditions
-        'E': 40,  # Steps
-        'F': 35,  # Expected
-        'G': 35,  # Actual
-        'H': 15,  # Status
-        'I': 12,  # Priority
-        'J': 15   # Type
-    }
-    
-    for col, width in column_widths.items():
-        ws.column_dimensions[col].width = width
+        ws.set_row(row_num, 60)
+        ws.write_row(row_num, 0, values[:status_col], cell_fmt)
+        ws.write_string(row_num, status_col, values[status_col], status_fmt)
+        ws.write_row(row_num, status_col + 1, values[status_col + 1:], cell_fmt)
     
     # Save workbook
-    wb.save(output_file)
-    print(f"✓ Excel file saved: {output_file}")
+    with fast_deflate():
+        wb.close()
     return output_file
 
 
@@ -157,4 +143,5 @@ if __name__ == "__main__":
     ]
     
     # Create Excel file
-    create_test_case_excel(sample_test_cases, "test_cases_output.xlsx")
+    output_file = create_test_case_excel(sample_test_cases, "test_cases_output.xlsx")
+    print(f"✓ Excel file saved: {output_file}")
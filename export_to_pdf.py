@@ -2,128 +2,227 @@
 Export test cases to PDF document (.pdf)
 Requires: reportlab
 Install: pip install reportlab
+Optional: pip install pypdf (renders large batches in parallel)
 """
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Frame, Table, TableStyle, Paragraph, Spacer
+from reportlab.platypus.doctemplate import LayoutError
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+import os
 
-def create_test_case_pdf(test_cases, output_file="test_cases.pdf"):
+from test_case_fields import count, iter_rows
+
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    PdfWriter = None
+
+_STYLES = getSampleStyleSheet()
+_NORMAL_STYLE = _STYLES['Normal']
+_LABEL_STYLE = _STYLES['Heading3']
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#1f4788'),
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.HexColor('#1f4788'),
+    spaceAfter=12,
+    spaceBefore=12,
+    fontName='Helvetica-Bold'
+)
+
+# Large batches are rendered in parallel shards; below these sizes worker start-up dominates
+_PARALLEL_THRESHOLD = 200
+_PARALLEL_MIN_PER_WORKER = 50
+
+# Page geometry: letter with half-inch margins
+_PAGE_WIDTH, _PAGE_HEIGHT = letter
+_MARGIN = 0.5*inch
+
+# Table layout shared by every test case
+_COL_WIDTHS = [1.5*inch, 5.5*inch]
+_TABLE_STYLE = TableStyle([
+    # Header row
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4472C4')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    
+    # First column (field names)
+    ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#D9E2F3')),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    
+    # All cells
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('PADDING', (0, 0), (-1, -1), 8),
+])
+
+@lru_cache(maxsize=4096)
+def _cell_paragraph(text):
+    """Details-column Paragraph; repeated values such as 'N/A' share one instance"""
+    return Paragraph(text, _NORMAL_STYLE)
+
+# Field-name column Paragraphs, identical for every test case
+_LABELS = {
+    label: Paragraph(label, _LABEL_STYLE)
+    for label in ('Field', 'ID', 'Description', 'Preconditions', 'Test Steps', 'Expected Result',
+                  'Actual Result', 'Status', 'Priority', 'Test Type')
+}
+
+def _draw_story(canv, story):
     """
-    Convert test cases to a formatted PDF document
+    Draw flowables onto the canvas, starting from the top of the current page
+    
+    Flowables that overflow are split onto following pages; the list is
+    consumed as it is drawn.
+    """
+    while True:
+        frame = Frame(_MARGIN, _MARGIN, _PAGE_WIDTH - 2*_MARGIN, _PAGE_HEIGHT - 2*_MARGIN)
+        frame.addFromList(story, canv)
+        if story:
+            # Draw whatever part of the next flowable fits and carry the rest over
+            parts = frame.split(story[0], canv)
+            if parts and frame.add(parts[0], canv, trySplit=0):
+                story[0:1] = parts[1:]
+            elif frame._atTop:
+                raise LayoutError(f"Flowable {story[0].identity(30)} too large for the page")
+        if not story:
+            return
+        canv.showPage()
+
+def _render_pages(output, rows, start=1, metadata=None):
+    """
+    Render test case rows to a PDF file or file-like object
     
     Args:
-        test_cases: List of dictionaries containing test case information
-        output_file: Output filename for the PDF document
+        output: Output filename or binary file-like object
+        rows: Test case rows in FIELDS order
+        start: Number of the first test case in rows
+        metadata: Metadata line for the title block; None omits the title block
     """
-    doc = SimpleDocTemplate(output_file, pagesize=letter,
-                           rightMargin=0.5*inch, leftMargin=0.5*inch,
-                           topMargin=0.5*inch, bottomMargin=0.5*inch)
+    # Each test case starts on its own page, so flowables are laid out straight
+    # onto the canvas instead of going through a document template
+    canv = Canvas(output, pagesize=letter, pageCompression=1)
     
     # Container for the 'Flowable' objects
     elements = []
     
-    # Define styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1f4788'),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#1f4788'),
-        spaceAfter=12,
-        spaceBefore=12,
-        fontName='Helvetica-Bold'
-    )
-    
-    normal_style = styles['Normal']
-    
-    # Add title
-    title = Paragraph("Test Cases Documentation", title_style)
-    elements.append(title)
-    
-    # Add metadata
-    metadata = f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total Test Cases: {len(test_cases)}"
-    elements.append(Paragraph(metadata, normal_style))
-    elements.append(Spacer(1, 0.3*inch))
+    if metadata is not None:
+        # Add title
+        title = Paragraph("Test Cases Documentation", _TITLE_STYLE)
+        elements.append(title)
+        
+        # Add metadata
+        elements.append(Paragraph(metadata, _NORMAL_STYLE))
+        elements.append(Spacer(1, 0.3*inch))
     
     # Process each test case
-    for idx, test_case in enumerate(test_cases, 1):
+    last = start + len(rows) - 1
+    for idx, row in enumerate(rows, start):
+        tc_id, tc_name, description, preconditions, steps, expected_result, actual_result, status, priority, test_type = row
+        
         # Test case header
-        tc_heading = Paragraph(f"Test Case #{idx}: {test_case.get('name', 'Unnamed Test')}", heading_style)
+        tc_heading = Paragraph(f"Test Case #{idx}: {tc_name}", _HEADING_STYLE)
         elements.append(tc_heading)
         
         # Create table data
         data = [
             ['Field', 'Details'],
-            ['ID', test_case.get('id', f'TC_{idx:03d}')],
-            ['Description', test_case.get('description', 'N/A')],
-            ['Preconditions', test_case.get('preconditions', 'N/A')],
-            ['Test Steps', test_case.get('steps', 'N/A')],
-            ['Expected Result', test_case.get('expected_result', 'N/A')],
-            ['Actual Result', test_case.get('actual_result', '')],
-            ['Status', test_case.get('status', 'Not Executed')],
-            ['Priority', test_case.get('priority', 'Medium')],
-            ['Test Type', test_case.get('test_type', 'Functional')]
+            ['ID', tc_id],
+            ['Description', description],
+            ['Preconditions', preconditions],
+            ['Test Steps', steps],
+            ['Expected Result', expected_result],
+            ['Actual Result', actual_result],
+            ['Status', status],
+            ['Priority', priority],
+            ['Test Type', test_type]
         ]
         
         # Convert data to Paragraphs for better text wrapping
-        formatted_data = []
-        for row in data:
-            formatted_row = [
-                Paragraph(str(cell), normal_style if i == 1 else styles['Heading3'])
-                for i, cell in enumerate(row)
-            ]
-            formatted_data.append(formatted_row)
+        formatted_data = [
+            [_LABELS[label], _cell_paragraph(value)]
+            for label, value in data
+        ]
         
         # Create table
-        table = Table(formatted_data, colWidths=[1.5*inch, 5.5*inch])
-        
-        # Style the table
-        table.setStyle(TableStyle([
-            # Header row
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4472C4')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            
-            # First column (field names)
-            ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#D9E2F3')),
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-            
-            # All cells
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('PADDING', (0, 0), (-1, -1), 8),
-        ]))
+        table = Table(formatted_data, colWidths=_COL_WIDTHS)
+        table.setStyle(_TABLE_STYLE)
         
         elements.append(table)
         elements.append(Spacer(1, 0.3*inch))
+        _draw_story(canv, elements)
         
         # Add page break after each test case (except the last one)
-        if idx < len(test_cases):
-            elements.append(PageBreak())
+        if idx < last:
+            canv.showPage()
+    
+    # Draw the title page on its own when there are no test cases
+    if elements:
+        _draw_story(canv, elements)
+    
+    # Write PDF
+    canv.save()
+
+def _render_shard(rows, start, metadata):
+    """Render a contiguous slice of test cases in a worker process and return the PDF bytes"""
+    buffer = BytesIO()
+    _render_pages(buffer, rows, start, metadata)
+    return buffer.getvalue()
+
+def create_test_case_pdf(test_cases, output_file="test_cases.pdf"):
+    """
+    Convert test cases to a formatted PDF document
+    
+    Args:
+        test_cases: List of dictionaries containing test case information,
+                    or a columnar {field: [values]} mapping
+        output_file: Output filename for the PDF document
+    """
+    total = count(test_cases)
+    rows = list(iter_rows(test_cases))
+    metadata = f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total Test Cases: {total}"
+    
+    workers = min(os.cpu_count() or 1, total // _PARALLEL_MIN_PER_WORKER)
+    if PdfWriter is None or total < _PARALLEL_THRESHOLD or workers < 2:
+        _render_pages(output_file, rows, 1, metadata)
+    else:
+        # Test cases never share a page, so contiguous shards can be rendered
+        # independently and concatenated in order
+        size = -(-total // workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_render_shard, rows[i:i + size], i + 1, metadata if i == 0 else None)
+                for i in range(0, total, size)
+            ]
+            writer = PdfWriter()
+            for future in futures:
+                writer.append(BytesIO(future.result()))
+        writer.write(output_file)
     
-    # Build PDF
-    doc.build(elements)
-    print(f"✓ PDF document saved: {output_file}")
     return output_file
 
 
@@ -156,4 +255,5 @@ if __name__ == "__main__":
     ]
     
     # Create PDF file
-    create_test_case_pdf(sample_test_cases, "test_cases_output.pdf")
+    output_file = create_test_case_pdf(sample_test_cases, "test_cases_output.pdf")
+    print(f"✓ PDF document saved: {output_file}")
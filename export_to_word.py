@@ -2,22 +2,52 @@
 Export test cases to Word document (.docx)
 Requires: python-docx
 Install: pip install python-docx
+Optional: pip install zlib-ng (faster compression of the saved file)
 """
 
 from docx import Document
 from docx.shared import Pt, RGBColor, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 from datetime import datetime
+from copy import deepcopy
 import json
 
+from test_case_fields import count, iter_rows
+from zip_compression import fast_deflate
+
+# Run properties for the bold field-name column, cloned into each label run
+_BOLD_RPR = OxmlElement('w:rPr')
+_BOLD_RPR.append(OxmlElement('w:b'))
+
+def _make_cell(width, text, rPr=None):
+    """Build a <w:tc> holding a single run of text, as _Cell.text would"""
+    tc = OxmlElement('w:tc')
+    tcPr = OxmlElement('w:tcPr')
+    tcPr.append(OxmlElement('w:tcW', {qn('w:type'): 'dxa', qn('w:w'): width}))
+    tc.append(tcPr)
+    p = OxmlElement('w:p')
+    r = OxmlElement('w:r')
+    if rPr is not None:
+        r.append(deepcopy(rPr))
+    # CT_R.text turns newlines and tabs into <w:br/> and <w:tab/>
+    r.text = text
+    p.append(r)
+    tc.append(p)
+    return tc
+
 def create_test_case_word(test_cases, output_file="test_cases.docx"):
     """
     Convert test cases to a formatted Word document
     
     Args:
-        test_cases: List of dictionaries containing test case information
+        test_cases: List of dictionaries containing test case information,
+                    or a columnar {field: [values]} mapping
         output_file: Output filename for the Word document
     """
+    total = count(test_cases)
+    
     doc = Document()
     
     # Add title
@@ -26,13 +56,15 @@ def create_test_case_word(test_cases, output_file="test_cases.docx"):
     
     # Add metadata
     doc.add_paragraph(f'Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-    doc.add_paragraph(f'Total Test Cases: {len(test_cases)}')
+    doc.add_paragraph(f'Total Test Cases: {total}')
     doc.add_paragraph('')
     
     # Process each test case
-    for idx, test_case in enumerate(test_cases, 1):
+    for idx, row in enumerate(iter_rows(test_cases), 1):
+        tc_id, tc_name, description, preconditions, steps, expected_result, actual_result, status, priority, test_type = row
+        
         # Test case header
-        heading = doc.add_heading(f'Test Case #{idx}: {test_case.get("name", "Unnamed Test")}', level=1)
+        heading = doc.add_heading(f'Test Case #{idx}: {tc_name}', level=1)
         
         # Create table for test case details
         table = doc.add_table(rows=0, cols=2)
@@ -40,30 +72,33 @@ def create_test_case_word(test_cases, output_file="test_cases.docx"):
         
         # Add test case fields
         fields = [
-            ('ID', test_case.get('id', f'TC_{idx:03d}')),
-            ('Description', test_case.get('description', 'N/A')),
-            ('Preconditions', test_case.get('preconditions', 'N/A')),
-            ('Test Steps', test_case.get('steps', 'N/A')),
-            ('Expected Result', test_case.get('expected_result', 'N/A')),
-            ('Actual Result', test_case.get('actual_result', '')),
-            ('Status', test_case.get('status', 'Not Executed')),
-            ('Priority', test_case.get('priority', 'Medium')),
-            ('Test Type', test_case.get('test_type', 'Functional')),
+            ('ID', tc_id),
+            ('Description', description),
+            ('Preconditions', preconditions),
+            ('Test Steps', steps),
+            ('Expected Result', expected_result),
+            ('Actual Result', actual_result),
+            ('Status', status),
+            ('Priority', priority),
+            ('Test Type', test_type),
         ]
         
+        # Build the rows directly as XML rather than through table.add_row()
+        tbl = table._tbl
+        label_width, value_width = (col.get(qn('w:w')) for col in tbl.tblGrid.gridCol_lst)
         for field_name, field_value in fields:
-            row = table.add_row()
-            row.cells[0].text = field_name
-            row.cells[1].text = str(field_value)
+            tr = OxmlElement('w:tr')
             # Bold the field names
-            row.cells[0].paragraphs[0].runs[0].font.bold = True
+            tr.append(_make_cell(label_width, field_name, _BOLD_RPR))
+            tr.append(_make_cell(value_width, field_value))
+            tbl.append(tr)
         
         # Add spacing
         doc.add_paragraph('')
     
     # Save document
-    doc.save(output_file)
-    print(f"✓ Word document saved: {output_file}")
+    with fast_deflate():
+        doc.save(output_file)
     return output_file
 
 
@@ -96,4 +131,5 @@ if __name__ == "__main__":
     ]
     
     # Create Word document
-    create_test_case_word(sample_test_cases, "test_cases_output.docx")
+    output_file = create_test_case_word(sample_test_cases, "test_cases_output.docx")
+    print(f"✓ Word document saved: {output_file}")
@@ -0,0 +1,41 @@
+"""
+Test case field layout shared by the exporters and export_all_formats
+"""
+
+# Defaults for missing test case fields ('id' is derived from position)
+FIELD_DEFAULTS = {
+    'name': 'Unnamed Test',
+    'description': 'N/A',
+    'preconditions': 'N/A',
+    'steps': 'N/A',
+    'expected_result': 'N/A',
+    'actual_result': '',
+    'status': 'Not Executed',
+    'priority': 'Medium',
+    'test_type': 'Functional',
+}
+
+# Test case fields in column order
+FIELDS = ('id', *FIELD_DEFAULTS)
+
+def iter_rows(test_cases):
+    """
+    Yield each test case as a tuple of string field values in FIELDS order
+
+    Accepts a list of test case dictionaries or the columnar
+    {field: [values]} mapping built by export_all_formats, whose values
+    are already strings.
+    """
+    if isinstance(test_cases, dict):
+        return zip(*(test_cases[field] for field in FIELDS))
+    return (
+        (
+            str(test_case.get('id', f'TC_{idx:03d}')),
+            *(str(test_case.get(field, default)) for field, default in FIELD_DEFAULTS.items())
+        )
+        for idx, test_case in enumerate(test_cases, 1)
+    )
+
+def count(test_cases):
+    """Number of test cases in either input shape"""
+    return len(test_cases['id']) if isinstance(test_cases, dict) else len(test_cases)
@@ -0,0 +1,42 @@
+"""
+Faster deflate for the zip containers written by the Word and Excel exporters
+Optional: pip install zlib-ng (faster compression of the saved files)
+
+python-docx and xlsxwriter expose no compression setting, so fast_deflate()
+temporarily replaces zipfile._get_compressor, a private CPython helper that
+may change between Python versions. The patch is process-wide: a lock keeps
+concurrent fast_deflate() calls from clobbering each other, but any other
+thread writing a zip file meanwhile also gets the faster setting. Exporters
+run in separate processes, so this is not an issue for export_all_formats.
+"""
+
+from contextlib import contextmanager
+from threading import Lock
+import zipfile
+
+# Deflate level for the zip container, used instead of zlib's default of 6
+try:
+    from zlib_ng import zlib_ng as _zlib
+    _DEFLATE_LEVEL = 6  # zlib-ng's level 6 already outpaces stdlib zlib's fastest levels
+except ImportError:
+    import zlib as _zlib
+    _DEFLATE_LEVEL = 3  # fast-strategy level: ~2.5x quicker than 6, ~10% larger output
+
+_PATCH_LOCK = Lock()
+
+@contextmanager
+def fast_deflate():
+    """Deflate with _zlib at _DEFLATE_LEVEL while zip files are written in this block"""
+    with _PATCH_LOCK:
+        original = zipfile._get_compressor
+
+        def get_compressor(compress_type, compresslevel=None):
+            if compress_type == zipfile.ZIP_DEFLATED and compresslevel is None:
+                return _zlib.compressobj(_DEFLATE_LEVEL, _zlib.DEFLATED, -15)
+            return original(compress_type, compresslevel)
+
+        zipfile._get_compressor = get_compressor
+        try:
+            yield
+        finally:
+            zipfile._get_compressor = original